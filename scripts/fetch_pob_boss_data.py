@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 import os
 import re
-import json
 import requests
 from datetime import datetime
 from slpp import slpp as lua
 
+from json_io import dumps_bytes
+
 # Source URLs
 BASE_RAW        = "https://raw.githubusercontent.com/PathOfBuildingCommunity/PathOfBuilding-PoE2/dev/src/Data"
 URL_BOSSES      = f"{BASE_RAW}/Bosses.lua"
@@ -14,41 +15,114 @@ URL_BOSS_SKILLS = f"{BASE_RAW}/BossSkills.lua"
 DATA_DIR_RAW = os.path.join("data", "raw_bosses")
 LATEST_DIR   = "data"
 
+# Start of a bosses["Key"] = { ... } assignment; the table body itself is
+# delimited by lua_table_end() since it can contain nested tables
+BOSS_START_RE = re.compile(r'bosses\["(?P<key>[^"]+)"\]\s*=\s*(?=\{)')
+# Lua tokens that affect brace depth: comments and strings, including long
+# brackets of any level (--[==[ ... ]==], [=[ ... ]=]), are matched whole so
+# braces inside them are skipped
+LUA_TOKEN_RE = re.compile(
+    r'--\[(?P<c>=*)\[.*?\](?P=c)\]|--[^\n]*|\[(?P<s>=*)\[.*?\](?P=s)\]'
+    r'|"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|[{}]',
+    re.DOTALL
+)
+
+# Both files come from raw.githubusercontent.com; reuse one keep-alive connection
+SESSION = requests.Session()
+
+def write_snapshot(obj, raw_path, latest_path):
+    """
+    Encode obj once, write it to the timestamped snapshot, then hardlink the
+    "latest" copy to it (falling back to writing the same bytes where links
+    are unsupported, e.g. across filesystems).
+    """
+    payload = dumps_bytes(obj)
+    with open(raw_path, "wb") as f:
+        f.write(payload)
+    if os.path.exists(latest_path):
+        os.remove(latest_path)
+    try:
+        os.link(raw_path, latest_path)
+    except OSError:
+        with open(latest_path, "wb") as f:
+            f.write(payload)
+
+def lua_table_end(text, start):
+    """
+    Return the index just past the table whose '{' is at text[start].
+    """
+    depth = 0
+    for tok in LUA_TOKEN_RE.finditer(text, start):
+        if tok.group() == "{":
+            depth += 1
+        elif tok.group() == "}":
+            depth -= 1
+            if depth == 0:
+                return tok.end()
+    raise ValueError(f"Unbalanced Lua table at offset {start}")
+
+def extract_boss_tables(lua_text):
+    """
+    Return [(key, table_source), ...] for every bosses["Key"] = {...} block.
+    Scanning stops at a table that never closes.
+    """
+    tables = []
+    pos = 0
+    while True:
+        m = BOSS_START_RE.search(lua_text, pos)
+        if not m:
+            break
+        try:
+            pos = lua_table_end(lua_text, m.end())
+        except ValueError as e:
+            print(f"⚠️  Failed to decode boss {m.group('key')}: {e}")
+            break
+        tables.append((m.group("key"), lua_text[m.end():pos]))
+    return tables
+
+def decode_boss_tables(tables):
+    """
+    Decode every table with one slpp call; only if that fails are they
+    decoded one by one so a single bad entry just skips that boss.
+    """
+    try:
+        if not tables:
+            return {}
+        combined = "{" + ",".join(f'["{key}"]={tbl}' for key, tbl in tables) + "}"
+        bosses = lua.decode(combined)
+        if not isinstance(bosses, dict):
+            raise ValueError("combined boss table did not decode to a dict")
+        return bosses
+    except Exception:
+        bosses = {}
+        for key, tbl in tables:
+            try:
+                bosses[key] = lua.decode(tbl)
+            except Exception as e:
+                print(f"⚠️  Failed to decode boss {key}: {e}")
+        return bosses
+
 def fetch_and_snapshot():
     os.makedirs(DATA_DIR_RAW, exist_ok=True)
     timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
 
     # --- Boss metadata parsing ---
     print("→ Fetching Bosses.lua…")
-    resp = requests.get(URL_BOSSES, timeout=30)
+    resp = SESSION.get(URL_BOSSES, timeout=30)
     resp.raise_for_status()
     lua_text = resp.text
 
-    # Extract bosses["Key"] = {...} blocks
-    boss_pattern = re.compile(
-        r'bosses\["(?P<key>[^"]+)"\]\s*=\s*(?P<table>\{.*?\})',
-        re.DOTALL
-    )
-    bosses = {}
-    for m in boss_pattern.finditer(lua_text):
-        key = m.group("key")
-        tbl = m.group("table")
-        try:
-            bosses[key] = lua.decode(tbl)
-        except Exception as e:
-            print(f"⚠️  Failed to decode boss {key}: {e}")
+    # Extract bosses["Key"] = {...} blocks and decode them
+    bosses = decode_boss_tables(extract_boss_tables(lua_text))
 
     # Save boss metadata JSON
     raw_bosses_path = os.path.join(DATA_DIR_RAW, f"bosses_{timestamp}.json")
-    with open(raw_bosses_path, "w", encoding="utf-8") as f:
-        json.dump(bosses, f, indent=2)
-    with open(os.path.join(LATEST_DIR, "bosses.json"), "w", encoding="utf-8") as f:
-        json.dump(bosses, f, indent=2)
+    write_snapshot(bosses, raw_bosses_path, os.path.join(LATEST_DIR, "bosses.json"))
     print(f"  • Boss metadata snapshot → raw_bosses/bosses_{timestamp}.json")
 
     # --- BossSkills parsing ---
     print("→ Fetching BossSkills.lua…")
-    resp2 = requests.get(URL_BOSS_SKILLS, timeout=30)
+    resp2 = SESSION.get(URL_BOSS_SKILLS, timeout=30)
     resp2.raise_for_status()
     skills_text = resp2.text
 
@@ -66,10 +140,7 @@ def fetch_and_snapshot():
 
     # Save boss skills JSON
     raw_skills_path = os.path.join(DATA_DIR_RAW, f"boss_skills_{timestamp}.json")
-    with open(raw_skills_path, "w", encoding="utf-8") as f:
-        json.dump(skills_obj, f, indent=2)
-    with open(os.path.join(LATEST_DIR, "boss_skills.json"), "w", encoding="utf-8") as f:
-        json.dump(skills_obj, f, indent=2)
+    write_snapshot(skills_obj, raw_skills_path, os.path.join(LATEST_DIR, "boss_skills.json"))
     print(f"  • BossSkills snapshot    → raw_bosses/boss_skills_{timestamp}.json")
 
     return bosses, skills_obj
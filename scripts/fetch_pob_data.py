@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 import requests
 import re
-import json
 import logging
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+from json_io import dumps_bytes
+
 # === Paths ===
 HERE = Path(__file__).parent
 ROOT = HERE.parent
@@ -42,16 +44,26 @@ RE_TABLE  = re.compile(r"\[\s*\"([^\"]+)\"\s*\]\s*=\s*\{([^}]+)\}", re.DOTALL)
 
 headers = {"Accept": "application/vnd.github.v3+json"}
 
+# Concurrent requests in flight during the crawl
+MAX_WORKERS = 16
+
+# One pooled session for every directory listing and file download, so the
+# crawl reuses connections instead of handshaking per request; the pool is
+# sized to the worker count so threads never wait on (or discard) connections
+SESSION = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_maxsize=MAX_WORKERS * 2)
+SESSION.mount("https://", _adapter)
+
 
 def fetch_dir(path):
     url = f"{REPO_API}/{path}?ref={BRANCH}"
-    resp = requests.get(url, headers=headers, timeout=10)
+    resp = SESSION.get(url, headers=headers, timeout=10)
     resp.raise_for_status()
     return resp.json()
 
 
 def fetch_file(download_url):
-    resp = requests.get(download_url, timeout=10)
+    resp = SESSION.get(download_url, timeout=10)
     resp.raise_for_status()
     return resp.text
 
@@ -91,32 +103,52 @@ def parse_table(content, file_path):
 
 def traverse_and_extract(base_path):
     results = defaultdict(list)
-    def walk(path):
-        try:
-            entries = fetch_dir(path)
-        except Exception as e:
-            logger.error(f"Failed to list {path}: {e}")
-            return
-        for ent in entries:
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        def walk(path, listing):
+            # listing is a future for fetch_dir(path); subdirectory listings
+            # are submitted as soon as their parent arrives so they download
+            # in parallel, while files are still collected in depth-first order
+            try:
+                entries = listing.result()
+            except Exception as e:
+                logger.error(f"Failed to list {path}: {e}")
+                return []
+            subdirs = {
+                ent['path']: executor.submit(fetch_dir, ent['path'])
+                for ent in entries if ent['type']=='dir'
+            }
+            files = []
+            for ent in entries:
+                p = ent['path']
+                if ent['type']=='dir':
+                    files += walk(p, subdirs[p])
+                elif p.endswith('.lua'):
+                    files.append(ent)
+            return files
+
+        def download(ent):
+            try:
+                return fetch_file(ent['download_url'])
+            except Exception as e:
+                logger.error(f"Failed to fetch {ent['path']}: {e}")
+                return None
+
+        files = walk('src/Data', executor.submit(fetch_dir, 'src/Data'))
+        # map() yields in submission order, so parsing (on this thread only)
+        # appends to results exactly as the sequential crawl did
+        for ent, txt in zip(files, executor.map(download, files)):
+            if txt is None:
+                continue
             p = ent['path']
-            if ent['type']=='dir':
-                walk(p)
-            elif p.endswith('.lua'):
-                try:
-                    txt = fetch_file(ent['download_url'])
-                except Exception as e:
-                    logger.error(f"Failed to fetch {p}: {e}")
-                    continue
-                if '/Uniques/' in p:
-                    results['uniques'] += parse_uniques(txt, p)
-                elif '/Bases/' in p:
-                    results['bases']   += parse_table(txt, p)
-                elif p.endswith('Gems.lua'):
-                    results['gems']    += parse_table(txt, p)
-                elif '/Skills/' in p:
-                    results['skills']  += parse_table(txt, p)
-                # ignore others
-    walk('src/Data')
+            if '/Uniques/' in p:
+                results['uniques'] += parse_uniques(txt, p)
+            elif '/Bases/' in p:
+                results['bases']   += parse_table(txt, p)
+            elif p.endswith('Gems.lua'):
+                results['gems']    += parse_table(txt, p)
+            elif '/Skills/' in p:
+                results['skills']  += parse_table(txt, p)
+            # ignore others
     return results
 
 
@@ -124,8 +156,8 @@ def save_json(data):
     for cat, items in data.items():
         path = CATEGORIES.get(cat)
         if path:
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(items, f, indent=2)
+            # encode in one go and write once rather than per json.dump chunk
+            path.write_bytes(dumps_bytes(items))
             logger.info(f"Saved {len(items)} to {path.name}")
 
 
@@ -12,6 +12,10 @@ from pathlib import Path
 from datetime import datetime
 from requests.exceptions import HTTPError
 
+from http_cache import (
+    load_cache, save_cache, conditional_headers, cached_outputs, remember
+)
+
 # ── Paths & Setup ────────────────────────────────────────────────────────────
 HERE         = Path(__file__).parent
 PROJECT_ROOT = HERE.parent
@@ -37,10 +41,14 @@ with MANIFEST.open(encoding="utf-8") as f:
 timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
 
 # ── Resilient GET with exponential backoff ───────────────────────────────────
+# Shared session: every stat file comes from the same host, so keep-alive
+# saves a TLS handshake per file
+SESSION = requests.Session()
+
 def safe_get(url, **kwargs):
     max_attempts = 5
     for attempt in range(1, max_attempts + 1):
-        resp = requests.get(url, **kwargs)
+        resp = SESSION.get(url, **kwargs)
         if resp.status_code == 429:
             wait = 2 ** attempt
             logger.warning(f"Rate limited fetching {url}, retrying in {wait}s (attempt {attempt}/{max_attempts})")
@@ -65,23 +73,29 @@ def list_specific_files():
         if e.get("type") == "file" and e.get("name", "").endswith(".lua")
     ]
 
+# ── Conditional snapshot: skip files unchanged since their last snapshot ─────
+http_cache = load_cache()
+
+def snapshot(url, fname):
+    resp = safe_get(url, headers=conditional_headers(http_cache, url), timeout=30)
+    if resp.status_code == 304:
+        logger.info(f"Unchanged {fname}, keeping {cached_outputs(http_cache, url)[0]}")
+        return
+    dest = RAW_DIR / f"{fname}_{timestamp}.lua"
+    dest.write_text(resp.text, encoding="utf-8")
+    remember(http_cache, url, resp, dest)
+    logger.info(f"Fetched {fname} → {dest}")
+
 # ── Fetch Loop ───────────────────────────────────────────────────────────────
 for entry in manifest.get("files", []):
     path = entry.get("path", "")
     if "*" in path:
         tmpl = entry["urlTemplate"]
         for fname in list_specific_files():
-            url = tmpl.replace("{filename}", fname)
-            resp = safe_get(url, timeout=30)
-            dest = RAW_DIR / f"{fname}_{timestamp}.lua"
-            dest.write_text(resp.text, encoding="utf-8")
-            logger.info(f"Fetched {fname} → {dest}")
+            snapshot(tmpl.replace("{filename}", fname), fname)
     else:
-        url = entry.get("url")
-        resp = safe_get(url, timeout=30)
-        fname = path.replace("/", "_")
-        dest = RAW_DIR / f"{fname}_{timestamp}.lua"
-        dest.write_text(resp.text, encoding="utf-8")
-        logger.info(f"Fetched {path} → {dest}")
+        snapshot(entry.get("url"), path.replace("/", "_"))
+
+save_cache(http_cache)
 
 print("All stat files fetched and snapshot to data/raw_stats/")
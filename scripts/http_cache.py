@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Conditional-GET bookkeeping shared by the fetch scripts.
+
+For every URL we remember the ETag / Last-Modified validators of the last
+full download together with the files written from it.  The next fetch sends
+If-None-Match / If-Modified-Since, and an HTTP 304 lets the caller skip the
+transfer, parse and rewrite because those files are still current.
+"""
+import json
+from pathlib import Path
+
+CACHE_PATH = Path(__file__).parent.parent / "data" / ".http_cache.json"
+
+def load_cache(path: Path = None) -> dict:
+    path = path or CACHE_PATH
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_cache(cache: dict, path: Path = None) -> None:
+    path = path or CACHE_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+
+def conditional_headers(cache: dict, url: str) -> dict:
+    """
+    Request headers that make `url` conditional on our last download.
+    Empty when there is nothing cached or any output file has since been
+    removed, so a 304 always means the recorded outputs can be reused.
+    """
+    entry = cache.get(url)
+    if not entry or not all(Path(p).exists() for p in entry.get("outputs", [])):
+        return {}
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+def cached_outputs(cache: dict, url: str) -> list:
+    """Files recorded for `url` by remember(), first one being the snapshot."""
+    return [Path(p) for p in cache.get(url, {}).get("outputs", [])]
+
+def remember(cache: dict, url: str, resp, *outputs: Path) -> None:
+    """Record the validators of a 200 response and the files written from it."""
+    cache[url] = {
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+        "outputs": [str(p) for p in outputs],
+    }
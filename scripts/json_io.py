@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+JSON encode/decode helpers shared by the fetch, parse and ETL scripts.
+
+orjson is used when installed and stdlib json otherwise. Both write UTF-8
+with non-ASCII characters as-is rather than escaped, and use the same
+indentation and separators.
+"""
+import json
+import os
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+# Snapshot files are only read back by scripts, so they are written compact;
+# set MCP_PRETTY_JSON=1 to get indented files for manual inspection
+PRETTY_JSON = os.environ.get("MCP_PRETTY_JSON") == "1"
+
+def dumps_bytes(obj, pretty: bool = PRETTY_JSON) -> bytes:
+    """
+    Encode obj as UTF-8 JSON, indented by two spaces when `pretty`.
+    Non-string dict keys (e.g. from slpp's int-keyed tables) become strings.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, option=option)
+    fmt = {"indent": 2} if pretty else {"separators": (",", ":")}
+    return json.dumps(obj, ensure_ascii=False, **fmt).encode("utf-8")
+
+def loads_bytes(raw: bytes):
+    """Decode a UTF-8 JSON document read in binary mode."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
@@ -1,13 +1,35 @@
-import json
 import os
+import sys
 import logging
 from collections import defaultdict
 
+from json_io import dumps_bytes, loads_bytes
+
 # Configure logging
 default_format = '%(asctime)s - %(levelname)s - %(message)s'
 logging.basicConfig(level=logging.INFO, format=default_format)
 logger = logging.getLogger(__name__)
 
+def node_type(skill_id: str, details: dict) -> str:
+    """
+    Determine a node's type for rendering from its skill_id and passive_skills entry.
+    """
+    if skill_id.startswith('Ascendancy'):
+        return 'Ascendancy'
+    if details.get('is_keystone'):
+        return 'Keystone'
+    if details.get('is_notable'):
+        return 'Notable'
+    if details.get('is_just_icon'):
+        return 'Mastery'
+    if 'socket' in skill_id.lower():
+        return 'Jewel Socket'
+    if 'Start' in skill_id:
+        return 'Start'
+    if 'Small' in skill_id:
+        return 'Small'
+    return 'Regular'
+
 def parse_poe2_tree(input_file: str, output_file: str):
     """
     Parse tree401.json to extract all data needed for GUI mapping of the PoE2 passive skill tree.
@@ -21,11 +43,13 @@ def parse_poe2_tree(input_file: str, output_file: str):
 
     # Load raw data
     logger.info(f"Loading tree data from {input_file}")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(input_file, 'rb') as f:
+        data = loads_bytes(f.read())
 
-    passive_tree = data.get('passive_tree', {})
-    passive_skills = data.get('passive_skills', {})
+    # Keep only the sections we read; the atlas trees are freed with data
+    passive_tree = data.pop('passive_tree', {})
+    passive_skills = data.pop('passive_skills', {})
+    del data
 
     # Extract groups
     groups = {}
@@ -41,9 +65,16 @@ def parse_poe2_tree(input_file: str, output_file: str):
     # Extract and clean nodes
     raw_nodes = passive_tree.get('nodes', {})
     nodes = {}
-    # 1) Remove self-loops and clamp outlier radii in connections
+    edges = set()
+    # Bound once; these run for every connection in the loop below
+    intern = sys.intern
+    add_edge = edges.add
+    # 1) Single pass over nodes: remove self-loops and clamp outlier radii in
+    # connections, index (from, to) links for mirroring, and enrich each node
+    # with skill metadata and type
     for nid, node in raw_nodes.items():
-        nid_str = str(nid)
+        # JSON object keys are already strings; only intern them
+        nid_str = intern(nid)
         # Base node info
         skill_id = node.get('skill_id')
         parent = node.get('parent')
@@ -52,11 +83,12 @@ def parse_poe2_tree(input_file: str, output_file: str):
         # Clean connections
         cleaned_conns = []
         for c in node.get('connections', []):
+            # Interned so every edge to a node shares one id string
             if isinstance(c, dict):
-                cid = str(c.get('id'))
+                cid = intern(str(c.get('id')))
                 crad = c.get('radius', 0)
             else:
-                cid = str(c)
+                cid = intern(str(c))
                 crad = 0
             # Drop self-loop
             if cid == nid_str:
@@ -65,58 +97,41 @@ def parse_poe2_tree(input_file: str, output_file: str):
             if crad == 2147483647:
                 crad = 0
             cleaned_conns.append({'id': cid, 'radius': crad})
+            add_edge((nid_str, cid))
+        details = passive_skills.get(skill_id or '', {})
         nodes[nid_str] = {
             'skill_id': skill_id,
-            'parent': str(parent),
+            'parent': intern(str(parent)),
             'position': position,
             'radius': radius,
-            'connections': cleaned_conns
+            'connections': cleaned_conns,
+            # Metadata
+            'name': details.get('name'),
+            'stats': details.get('stats', {}),
+            'icon': details.get('icon'),
+            'ascendancy': details.get('ascendancy'),
+            'is_notable': details.get('is_notable', False),
+            'is_keystone': details.get('is_keystone', False),
+            'is_multiple_choice': details.get('is_multiple_choice', False),
+            'node_type': node_type(skill_id or '', details)
         }
 
-    # 2) Mirror connections to make the graph undirected
+    # 2) Mirror connections to make the graph undirected; the reverse-link
+    # check is a lookup in the edge-pair set built above
     for nid, node in nodes.items():
         for conn in node['connections']:
             cid = conn['id']
-            if cid in nodes:
-                # Check if reverse link exists
-                reverse = nodes[cid]['connections']
-                if not any(rc['id'] == nid for rc in reverse):
-                    reverse.append({'id': nid, 'radius': conn['radius']})
-
-    # 3) Enrich nodes with skill metadata and type
-    for nid, node in nodes.items():
-        skill_id = node['skill_id'] or ''
-        details = passive_skills.get(skill_id, {})
-        # Metadata
-        node['name'] = details.get('name')
-        node['stats'] = details.get('stats', {})
-        node['icon'] = details.get('icon')
-        node['ascendancy'] = details.get('ascendancy')
-        node['is_notable'] = details.get('is_notable', False)
-        node['is_keystone'] = details.get('is_keystone', False)
-        node['is_multiple_choice'] = details.get('is_multiple_choice', False)
-        # Determine node type for rendering
-        if skill_id.startswith('Ascendancy'):
-            ntype = 'Ascendancy'
-        elif details.get('is_keystone'):
-            ntype = 'Keystone'
-        elif details.get('is_notable'):
-            ntype = 'Notable'
-        elif details.get('is_just_icon'):
-            ntype = 'Mastery'
-        elif 'socket' in skill_id.lower():
-            ntype = 'Jewel Socket'
-        elif 'Start' in skill_id:
-            ntype = 'Start'
-        elif 'Small' in skill_id:
-            ntype = 'Small'
-        else:
-            ntype = 'Regular'
-        node['node_type'] = ntype
+            if cid in nodes and (cid, nid) not in edges:
+                nodes[cid]['connections'].append({'id': nid, 'radius': conn['radius']})
+                edges.add((cid, nid))
 
     # Extract root passives
     root_passives = [str(rp) for rp in passive_tree.get('root_passives', [])]
 
+    # Release the input tree and edge index so only the output is alive
+    # while its JSON buffer is built
+    del raw_nodes, passive_tree, passive_skills, edges, add_edge
+
     # Consolidate output
     output_data = {
         'groups': groups,
@@ -124,10 +139,11 @@ def parse_poe2_tree(input_file: str, output_file: str):
         'root_passives': root_passives
     }
 
-    # Write to skill_tree_data.json
+    # Write to skill_tree_data.json; encode to one buffer so the file gets a
+    # single write instead of one per json.dump chunk
     logger.info(f"Writing parsed data to {output_file}")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    with open(output_file, 'wb') as f:
+        f.write(dumps_bytes(output_data, pretty=True))
     logger.info("Parsing complete.")
 
 if __name__ == '__main__':
@@ -1,7 +1,7 @@
 # scripts/analyze_tree401.py
 #!/usr/bin/env python3
-import json
 import logging
+import sys
 from collections import defaultdict
 from pathlib import Path
 
@@ -12,6 +12,12 @@ DATA_DIR     = PROJECT_ROOT / "data"
 OUTPUT_DIR   = PROJECT_ROOT / "output"
 LOG_DIR      = PROJECT_ROOT / "logs" / "analyze_tree401"
 
+# scripts/ holds the shared helpers
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from json_io import loads_bytes
+
 # Ensure directories exist
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -29,6 +35,40 @@ logger = logging.getLogger(__name__)
 def log_message(level, category, message):
     logger.log(level, message, extra={"category": category})
 
+# Top-level sections the analysis reads; the atlas trees are dropped on load
+TREE_SECTIONS = ("passive_tree", "passive_skills")
+
+def load_tree_sections(json_file: Path):
+    """
+    Parse json_file and keep only the TREE_SECTIONS subtrees.
+    Returns (top_level_keys, data) where data holds just those sections.
+    """
+    full = loads_bytes(json_file.read_bytes())
+    # Only the kept sections outlive this call; atlas data is freed on return
+    return list(full), {k: full.pop(k) for k in TREE_SECTIONS if k in full}
+
+def classify_node(skill_id: str, details: dict) -> str:
+    """
+    Map a node's skill_id and its passive_skills entry to a display type.
+    """
+    if skill_id.startswith("Ascendancy"):
+        return "Ascendancy"
+    if details.get("is_keystone"):
+        return "Keystone"
+    if details.get("is_notable"):
+        return "Notable"
+    if details.get("is_just_icon"):
+        return "Mastery"
+    if details.get("is_multiple_choice"):
+        return "Choice"
+    if "socket" in skill_id.lower():
+        return "Jewel Socket"
+    if "Start" in skill_id:
+        return "Start"
+    if "Small" in skill_id:
+        return "Small"
+    return "Regular"
+
 def analyze_tree401(json_file: Path,
                     output_file: Path = OUTPUT_DIR / "tree401_analysis.txt"):
     """
@@ -39,63 +79,50 @@ def analyze_tree401(json_file: Path,
     try:
         # Load JSON data
         log_message(logging.DEBUG, "FILE", f"Loading {json_file}")
-        with json_file.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        top_level_keys, data = load_tree_sections(json_file)
 
         # Preliminary Cleaning
         raw_passive = data.get("passive_tree", {}).get("nodes", {})
+        passive_skills = data.get("passive_skills", {})
         self_loops = []
         outlier_count = 0
+        linked = set()
 
-        # Remove self-loops & clamp huge radii; mirror connections
+        # Single pass over nodes: remove self-loops & clamp huge radii, index
+        # (from, to) links for mirroring, and tag node types
         for nid, node in raw_passive.items():
             conns = node.get("connections", [])
             cleaned = []
             for c in conns:
-                cid = str(c.get("id", c)) if isinstance(c, dict) else str(c)
-                radius = c.get("radius", 0) if isinstance(c, dict) else 0
-                if cid == str(nid):
+                if isinstance(c, dict):
+                    cid = str(c.get("id", c))
+                    radius = c.get("radius", 0)
+                else:
+                    cid = str(c)
+                    radius = 0
+                # JSON object keys are already strings, so nid needs no str()
+                if cid == nid:
                     self_loops.append(nid)
                     continue
                 if radius == 2147483647:
                     radius = 0
                     outlier_count += 1
                 cleaned.append({"id": cid, "radius": radius})
+                linked.add((nid, cid))
             node["connections"] = cleaned
 
-        # Mirror undirected edges
+            sid = node.get("skill_id", "")
+            node["node_type"] = classify_node(sid, passive_skills.get(sid, {}))
+
+        # Mirror undirected edges; the reverse-link check is a set lookup
+        # instead of a scan of the target's connection list
         for nid, node in raw_passive.items():
             for c in node["connections"]:
                 cid = c["id"]
                 target = raw_passive.get(cid)
-                if target is not None:
-                    if not any(str(x.get("id", x)) == str(nid) for x in target.get("connections", [])):
-                        target.setdefault("connections", []).append({"id": str(nid), "radius": c["radius"]})
-
-        # Tag node types
-        passive_skills = data.get("passive_skills", {})
-        for nid, node in raw_passive.items():
-            sid = node.get("skill_id", "")
-            details = passive_skills.get(sid, {})
-            if sid.startswith("Ascendancy"):
-                t = "Ascendancy"
-            elif details.get("is_keystone"):
-                t = "Keystone"
-            elif details.get("is_notable"):
-                t = "Notable"
-            elif details.get("is_just_icon"):
-                t = "Mastery"
-            elif details.get("is_multiple_choice"):
-                t = "Choice"
-            elif "socket" in sid.lower():
-                t = "Jewel Socket"
-            elif "Start" in sid:
-                t = "Start"
-            elif "Small" in sid:
-                t = "Small"
-            else:
-                t = "Regular"
-            node["node_type"] = t
+                if target is not None and (cid, nid) not in linked:
+                    target.setdefault("connections", []).append({"id": nid, "radius": c["radius"]})
+                    linked.add((cid, nid))
 
         # Build analysis report
         analysis = [
@@ -105,7 +132,7 @@ def analyze_tree401(json_file: Path,
             "Connections mirrored for undirected graph.",
             "",
             "=== Data Structure Overview ===",
-            f"Top-level keys: {list(data.keys())}"
+            f"Top-level keys: {top_level_keys}"
         ]
 
         pt = data.get("passive_tree", {})
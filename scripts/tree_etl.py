@@ -16,9 +16,13 @@ if str(SCRIPT_DIR) not in sys.path:
 
 from tree_loader import (
     EFFECT_INSERT_SQL,
-    load_nodes, load_edges, mirror_edges,
+    index_nodes, load_nodes, load_edges, mirror_edges,
     load_starting_nodes, load_ascendancy_nodes
 )
+from json_io import loads_bytes
+from http_cache import (
+    load_cache, save_cache, conditional_headers, cached_outputs, remember
+)
 
 # ── Paths ────────────────────────────────────────────────────────────────────
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -45,6 +49,9 @@ POB_RAW_BASE = (
 )
 TAG_MAP = {"401": "0_2"}
 
+# Shared HTTP session (connection pooling for repeated fetches in one process)
+SESSION = requests.Session()
+
 def get_pob_folder(poe_version: str) -> str:
     folder = TAG_MAP.get(poe_version)
     if not folder:
@@ -57,19 +64,32 @@ def fetch_tree(poe_version: str) -> Path:
     2) Snapshot it to data/raw_trees
     3) Wrap into { passive_tree: {...}, passive_skills: {...} }
     4) Write wrapper to data/tree.json and data/tree{poe_version}.json
+
+    If upstream answers 304 Not Modified, nothing is rewritten and the
+    previous raw snapshot is returned.
     """
     folder = get_pob_folder(poe_version)
     url = f"{POB_RAW_BASE}/src/TreeData/{folder}/tree.json"
-    resp = requests.get(url, timeout=30)
-    resp.raise_for_status()
-
-    # 1) Save raw snapshot
-    ts = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-    raw_file = RAW_DIR / f"{poe_version}_{folder}_{ts}.json"
-    raw_file.write_text(resp.text, encoding="utf-8")
-
-    # 2) Decode JSON
-    raw_data = resp.json()
+    cache = load_cache()
+    with SESSION.get(url, headers=conditional_headers(cache, url),
+                     stream=True, timeout=30) as resp:
+        if resp.status_code == 304:
+            raw_file = cached_outputs(cache, url)[0]
+            logger.info(f"{url} unchanged; reusing {raw_file}")
+            print(raw_file)
+            return raw_file
+        resp.raise_for_status()
+
+        # 1) Stream raw snapshot straight to disk; the upstream bytes are
+        #    already the JSON we want, so there is no str decode/re-encode
+        ts = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+        raw_file = RAW_DIR / f"{poe_version}_{folder}_{ts}.json"
+        with raw_file.open("wb") as f:
+            for chunk in resp.iter_content(chunk_size=1 << 16):
+                f.write(chunk)
+
+    # 2) Decode JSON from the snapshot
+    raw_data = parse_json(raw_file)
 
     # 3) Build our wrapper
     wrapper = {
@@ -87,14 +107,19 @@ def fetch_tree(poe_version: str) -> Path:
             node["skill_id"] = node["skillId"]
 
     # 5) Write wrapped JSON for ETL & tests
-    (DATA_DIR / "tree.json").write_text(json.dumps(wrapper), encoding="utf-8")
-    (DATA_DIR / f"tree{poe_version}.json").write_text(json.dumps(wrapper), encoding="utf-8")
+    payload = json.dumps(wrapper).encode("utf-8")
+    (DATA_DIR / "tree.json").write_bytes(payload)
+    (DATA_DIR / f"tree{poe_version}.json").write_bytes(payload)
+
+    remember(cache, url, resp, raw_file,
+             DATA_DIR / "tree.json", DATA_DIR / f"tree{poe_version}.json")
+    save_cache(cache)
 
     print(raw_file)
     return raw_file
 
 def parse_json(json_path: Path) -> dict:
-    return json.loads(json_path.read_text(encoding="utf-8"))
+    return loads_bytes(json_path.read_bytes())
 
 def upsert_version(conn: sqlite3.Connection, source: str) -> int:
     cur = conn.execute(
@@ -104,10 +129,11 @@ def upsert_version(conn: sqlite3.Connection, source: str) -> int:
     return cur.lastrowid
 
 def load_pipeline(conn: sqlite3.Connection, vid: int, data: dict):
-    # 1) Store raw snapshot
+    # 1) Store raw snapshot (encoded once; reused for the ascendancy snapshot)
+    raw_json = json.dumps(data)
     conn.execute(
         "INSERT OR REPLACE INTO raw_trees(version_id,raw_json) VALUES(?,?)",
-        (vid, json.dumps(data))
+        (vid, raw_json)
     )
 
     # 2) Unwrap
@@ -118,7 +144,7 @@ def load_pipeline(conn: sqlite3.Connection, vid: int, data: dict):
         tree_data = data
         skills_data = data.get("passive_skills", {})
 
-    nodes  = tree_data.get("nodes", {})
+    nodes  = index_nodes(tree_data.get("nodes", {}))
     groups = tree_data.get("groups", [])
 
     # 3) Load nodes & edges
@@ -128,12 +154,7 @@ def load_pipeline(conn: sqlite3.Connection, vid: int, data: dict):
 
     # 4) Load node_effects, using either snake_case or camelCase
     count = 0
-    for nid_str, node in nodes.items():
-        try:
-            nid = int(nid_str)
-        except ValueError:
-            continue
-
+    for nid, node in nodes.items():
         # pick up either field
         skill_key = node.get("skill_id") or node.get("skillId")
         stats = skills_data.get(skill_key, {}).get("stats", [])
@@ -147,7 +168,7 @@ def load_pipeline(conn: sqlite3.Connection, vid: int, data: dict):
     asc_vid = conn.execute("INSERT INTO ascendancy_versions DEFAULT VALUES;").lastrowid
     conn.execute(
         "INSERT INTO raw_ascendancy_snapshots(version_id,raw_json) VALUES(?,?)",
-        (asc_vid, json.dumps(data))
+        (asc_vid, raw_json)
     )
     load_ascendancy_nodes(conn, asc_vid, nodes, groups)
 
@@ -41,9 +41,41 @@ VALUES (?, ?, ?, ?, ?, ?, ?, ?);
 logger = logging.getLogger(__name__)
 
 # ── POSITION & TYPE EXTRACTORS ─────────────────────────────────────────────────
-def extract_position(n: dict, nid: int, groups) -> tuple[int, int]:
+def index_groups(groups) -> dict:
+    """
+    Normalize groups (a list of {'id': ...} dicts or a dict keyed by id) into
+    a dict keyed by str(id), so each node's group lookup is one hash probe.
+    """
+    if isinstance(groups, dict):
+        return {str(gid): g for gid, g in groups.items()}
+    index = {}
+    if isinstance(groups, list):
+        for g in groups:
+            if isinstance(g, dict) and g.get("id") is not None:
+                index.setdefault(str(g["id"]), g)
+    return index
+
+
+def index_nodes(nodes: dict) -> dict:
+    """
+    Re-key the tree's nodes by int id, dropping non-numeric keys. Keys that
+    are already ints pass straight through, so re-indexing an index is cheap.
+    """
+    index = {}
+    for nid, n in nodes.items():
+        if isinstance(nid, int):
+            index[nid] = n
+        # Checked up front rather than via int() raising, which is costly
+        # for every non-numeric key
+        elif nid.isdecimal() or (nid[:1] == "-" and nid[1:].isdecimal()):
+            index[int(nid)] = n
+    return index
+
+
+def extract_position(n: dict, nid: int, groups: dict) -> tuple[int, int]:
     """
     1) Use nested 'position'. 2) Use n['x'],n['y']. 3) Use group's 'id' lookup. 4) Default to (0,0).
+    `groups` is the index built by index_groups().
     """
     # nested
     pos = n.get("position")
@@ -54,22 +86,12 @@ def extract_position(n: dict, nid: int, groups) -> tuple[int, int]:
     if rx is not None and ry is not None:
         return int(rx), int(ry)
     # group lookup
-    grp_id = n.get("group")
-    grp = {}
-    if isinstance(groups, list):
-        for g in groups:
-            if not isinstance(g, dict):
-                continue
-            if g.get("id") == grp_id:
-                grp = g
-                break
-    elif isinstance(groups, dict):
-        grp = groups.get(grp_id) or groups.get(str(grp_id), {})
+    grp = groups.get(str(n.get("group")), {})
     rx, ry = grp.get("x"), grp.get("y")
     if rx is not None and ry is not None:
         return int(rx), int(ry)
     # fallback
-    logger.warning(f"Node {nid}: missing coords; defaulting to (0,0)")
+    logger.warning("Node %s: missing coords; defaulting to (0,0)", nid)
     return 0, 0
 
 
@@ -82,13 +104,13 @@ def compute_node_type(n: dict) -> str:
     return "Regular"
 
 # ── LOADERS ────────────────────────────────────────────────────────────────────
+# Loaders accept the tree's str-keyed nodes or an index_nodes() result, and
+# raw or indexed groups; both are normalized on entry.
 def load_nodes(conn: sqlite3.Connection, vid: int, nodes: dict, groups):
+    nodes = index_nodes(nodes)
+    groups = index_groups(groups)
     count = 0
-    for nid_str, n in nodes.items():
-        try:
-            nid = int(nid_str)
-        except ValueError:
-            continue
+    for nid, n in nodes.items():
         x, y = extract_position(n, nid, groups)
         ntype = compute_node_type(n)
         name = n.get("name") or ""
@@ -102,31 +124,36 @@ def load_nodes(conn: sqlite3.Connection, vid: int, nodes: dict, groups):
 
 
 def load_edges(conn: sqlite3.Connection, vid: int, nodes: dict):
-    for nid_str, n in nodes.items():
-        nid = int(nid_str)
+    nodes = index_nodes(nodes)
+    # Collect each undirected pair once, however many times (and in which
+    # direction) it is listed, then write both directions in one batch
+    pairs = set()
+    for nid, n in nodes.items():
         for c in n.get("connections", []):
             cid = int(c.get("id") if isinstance(c, dict) else c)
-            conn.execute(EDGE_INSERT_SQL, (nid, cid, vid))
-            conn.execute(EDGE_INSERT_SQL, (cid, nid, vid))
-    logger.info("Loaded node_edges")
+            pairs.add((nid, cid) if nid <= cid else (cid, nid))
+    rows = [(a, b, vid) for a, b in pairs]
+    rows += [(b, a, vid) for a, b in pairs if a != b]
+    conn.executemany(EDGE_INSERT_SQL, rows)
+    logger.info(f"Loaded {len(rows)} node_edges")
 
 
 def mirror_edges(conn: sqlite3.Connection, vid: int):
+    # Reverse edges that already exist hit the primary key and are ignored,
+    # so no NOT IN anti-join over node_edges is needed
     conn.execute("""
       INSERT OR IGNORE INTO node_edges(from_node_id,to_node_id,version_id)
       SELECT to_node_id,from_node_id,version_id
         FROM node_edges
        WHERE version_id=?
-         AND (to_node_id,from_node_id,version_id)
-             NOT IN (SELECT from_node_id,to_node_id,version_id FROM node_edges WHERE version_id=?)
-    """, (vid, vid))
+    """, (vid,))
     logger.info("Mirrored reverse edges")
 
 
 def load_effects(conn: sqlite3.Connection, vid: int, nodes: dict):
+    nodes = index_nodes(nodes)
     count = 0
-    for nid_str, n in nodes.items():
-        nid = int(nid_str)
+    for nid, n in nodes.items():
         for stat in n.get("stats", []):
             conn.execute(EFFECT_INSERT_SQL, (nid, stat, 0.0, vid))
             count += 1
@@ -137,15 +164,13 @@ def load_starting_nodes(conn: sqlite3.Connection, vid: int, nodes: dict, groups)
     """
     Inserts starting nodes by using each node's 'classesStart' list.
     """
+    nodes = index_nodes(nodes)
+    groups = index_groups(groups)
     count = 0
-    for nid_str, n in nodes.items():
+    for nid, n in nodes.items():
         classes = n.get("classesStart") or []
         if not isinstance(classes, list):
             continue
-        try:
-            nid = int(nid_str)
-        except ValueError:
-            continue
         x, y = extract_position(n, nid, groups)
         for cls in classes:
             conn.execute(STARTING_NODE_SQL, (vid, nid, cls, x, y))
@@ -154,15 +179,13 @@ def load_starting_nodes(conn: sqlite3.Connection, vid: int, nodes: dict, groups)
 
 
 def load_ascendancy_nodes(conn: sqlite3.Connection, asc_vid: int, nodes: dict, groups):
+    nodes = index_nodes(nodes)
+    groups = index_groups(groups)
     count = 0
-    for nid_str, n in nodes.items():
+    for nid, n in nodes.items():
         asc = n.get("ascendancyName")
         if not asc:
             continue
-        try:
-            nid = int(nid_str)
-        except ValueError:
-            continue
         x, y = extract_position(n, nid, groups)
         name = n.get("name") or ""
         desc = n.get("description") or ""
@@ -1,6 +1,5 @@
 # src/api/metrics.py
 
-import re
 from typing import Dict, List, Tuple
 
 from .schemas import BuildMetrics
@@ -14,8 +13,8 @@ DAMAGE_TYPES = [
     "Projectile Damage",
 ]
 
-# Pattern for critical strike chance
-CRIT_PATTERN = re.compile(r"Critical Strike Chance", re.IGNORECASE)
+# Critical strike chance, matched case-insensitively against lowered stat keys
+CRIT_KEY = "critical strike chance"
 
 def compute_metrics(
     node_list: List[int],
@@ -46,7 +45,7 @@ def compute_metrics(
             armor += value
         if 'Energy Shield' in stat_key:
             eshield += value
-        if CRIT_PATTERN.search(stat_key):
+        if CRIT_KEY in stat_key.lower():
             crit_chance += value
         for dt in DAMAGE_TYPES:
             if dt in stat_key:
@@ -1,6 +1,6 @@
 # src/api/optimizer.py
 import re
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Pattern
 
 # Define how high-level goals map to stat_key patterns and scoring weights
 GOAL_CRITERIA: Dict[str, Dict[str, Any]] = {
@@ -59,11 +59,21 @@ def build_stat_weights(goals: List[str]) -> Dict[str, float]:
     return weights
 
 
+def compile_stat_weights(
+    stat_weights: Dict[str, float]
+) -> List[Tuple[Pattern[str], float]]:
+    """
+    Compile each stat_key pattern once so node scoring does not go back
+    through re's pattern cache for every (stat, pattern) pair.
+    """
+    return [(re.compile(pat, re.IGNORECASE), w) for pat, w in stat_weights.items()]
+
+
 def node_score(
     node_id: Any,
     node_effects: Dict[Any, List[Tuple[str, float]]],
     parsed_mods: Dict[Any, List[Tuple[str, float, float, bool]]],
-    stat_weights: Dict[str, float]
+    stat_patterns: List[Tuple[Pattern[str], float]]
 ) -> float:
     """
     Compute a heuristic score for a single node based on its effects and goal patterns.
@@ -74,14 +84,14 @@ def node_score(
 
     # Score static node effects
     for stat_key, value in effects:
-        for pat, w in stat_weights.items():
-            if re.search(pat, stat_key, re.IGNORECASE):
+        for pat, w in stat_patterns:
+            if pat.search(stat_key):
                 score += value * w
     # Score parsed mods by average
     for stat_key, mn, mx, is_range in mods:
         avg = ((mn + mx) / 2) if (mn is not None and mx is not None) else (mn or 0)
-        for pat, w in stat_weights.items():
-            if re.search(pat, stat_key, re.IGNORECASE):
+        for pat, w in stat_patterns:
+            if pat.search(stat_key):
                 score += avg * w
     return score
 
@@ -100,16 +110,21 @@ def optimize_path(
     Greedy graph expansion: pick highest-scoring neighbor nodes until max_points reached.
     """
     # Build scoring weights from high-level goals
-    stat_weights = build_stat_weights(goals)
+    stat_patterns = compile_stat_weights(build_stat_weights(goals))
     selected = {start_node}
     path = [start_node]
     frontier = set(edges.get(start_node, [])) - selected
+    # A node's score depends only on its static effects, so each frontier
+    # node is scored once rather than on every expansion step
+    scores: Dict[int, float] = {}
 
     while len(path) < max_points and frontier:
         best_node = None
         best_score = 0.0
-        for node in list(frontier):
-            score = node_score(node, node_effects, parsed_mods, stat_weights)
+        for node in frontier:
+            score = scores.get(node)
+            if score is None:
+                score = scores[node] = node_score(node, node_effects, parsed_mods, stat_patterns)
             if score > best_score:
                 best_score = score
                 best_node = node
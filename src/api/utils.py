@@ -38,10 +38,15 @@ def load_passive_graph(
         (version_id,)
     )
     edge_rows = cur.fetchall()
-    edges: Dict[int, List[int]] = { node_id: [] for node_id in nodes }
+    # node_edges stores both directions of each link, so collect neighbors in
+    # insertion-ordered dicts to keep each one once per node
+    adjacency: Dict[int, Dict[int, None]] = { node_id: {} for node_id in nodes }
     for from_id, to_id in edge_rows:
-        edges.setdefault(from_id, []).append(to_id)
-        edges.setdefault(to_id, []).append(from_id)
+        adjacency.setdefault(from_id, {})[to_id] = None
+        adjacency.setdefault(to_id, {})[from_id] = None
+    edges: Dict[int, List[int]] = {
+        node_id: list(nbrs) for node_id, nbrs in adjacency.items()
+    }
 
     return nodes, edges
 
@@ -0,0 +1,41 @@
+import sys
+import os
+import sqlite3
+import pytest
+
+# Ensure the 'src' directory is on sys.path to import our API modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from api.utils import load_passive_graph
+
+
+@pytest.fixture
+def db():
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE passive_nodes (node_id INTEGER, version_id INTEGER, x INTEGER,"
+        " y INTEGER, node_type TEXT, name TEXT)"
+    )
+    conn.execute(
+        "CREATE TABLE node_edges (from_node_id INTEGER, to_node_id INTEGER, version_id INTEGER)"
+    )
+    conn.executemany(
+        "INSERT INTO passive_nodes VALUES (?, 1, 0, 0, 'Regular', ?)",
+        [(1, "A"), (2, "B"), (3, "C"), (4, "D")]
+    )
+    # The ETL stores every link in both directions
+    conn.executemany(
+        "INSERT INTO node_edges VALUES (?, ?, 1)",
+        [(1, 2), (2, 1), (2, 3), (3, 2)]
+    )
+    # Another version's edges must not leak in
+    conn.execute("INSERT INTO node_edges VALUES (1, 4, 2)")
+    yield conn
+    conn.close()
+
+
+def test_load_passive_graph_lists_each_neighbor_once(db):
+    nodes, edges = load_passive_graph(db, 1)
+
+    assert set(nodes) == {1, 2, 3, 4}
+    assert edges == {1: [2], 2: [1, 3], 3: [2], 4: []}
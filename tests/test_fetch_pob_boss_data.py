@@ -0,0 +1,72 @@
+import sys
+import os
+import pytest
+
+# Ensure the 'scripts' directory is on sys.path to import the fetch modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts')))
+
+import fetch_pob_boss_data as boss
+
+BOSSES_LUA = '''local bosses = {}
+-- a stray { in a line comment
+bosses["Atziri"] = {
+	armourMult = 100,
+	damageRange = { min = 1, max = 2 },
+	tip = "has } brace",
+	quote = 'it\\'s {',
+}
+--[==[ block comment with ]] and { inside ]==]
+bosses["Xesht"] = { isUber = true, tags = { "a", "b" }, note = [=[ } ]] { ]=] }
+return bosses
+'''
+
+
+def test_extract_boss_tables_balances_nested_braces():
+    tables = boss.extract_boss_tables(BOSSES_LUA)
+
+    assert [key for key, _ in tables] == ["Atziri", "Xesht"]
+    assert tables[0][1].endswith("quote = 'it\\'s {',\n}")
+    assert tables[1][1] == '{ isUber = true, tags = { "a", "b" }, note = [=[ } ]] { ]=] }'
+
+
+def test_lua_table_end_skips_braces_in_strings_and_comments():
+    text = '{ a = "}", --[[ } ]]\n b = [==[ ]=] } ]==], c = { } -- }\n} tail'
+    assert text[:boss.lua_table_end(text, 0)].endswith("-- }\n}")
+
+
+def test_unclosed_table_stops_extraction():
+    text = 'bosses["Ok"] = { x = 1 }\nbosses["Broken"] = { y = { 2 }\n'
+    tables = boss.extract_boss_tables(text)
+    assert tables == [("Ok", "{ x = 1 }")]
+
+    with pytest.raises(ValueError):
+        boss.lua_table_end(text, text.index("{", text.index("Broken")))
+
+
+def test_decode_boss_tables_decodes_in_one_pass():
+    bosses = boss.decode_boss_tables(boss.extract_boss_tables(BOSSES_LUA))
+
+    assert bosses["Atziri"]["damageRange"] == {"min": 1, "max": 2}
+    assert bosses["Atziri"]["tip"] == "has } brace"
+    assert bosses["Xesht"]["tags"] == ["a", "b"]
+    assert boss.decode_boss_tables([]) == {}
+
+
+def test_decode_boss_tables_falls_back_per_table(monkeypatch):
+    real_decode = boss.lua.decode
+    calls = []
+
+    class FlakyLua:
+        # Fails the combined table and the "Bad" entry; decodes the rest
+        @staticmethod
+        def decode(text):
+            calls.append(text)
+            if text.startswith('{["') or "bad" in text:
+                raise ValueError("cannot decode")
+            return real_decode(text)
+
+    monkeypatch.setattr(boss, "lua", FlakyLua)
+    tables = [("Good", "{ hp = 1 }"), ("Bad", "{ bad = }"), ("Also", "{ hp = 2 }")]
+
+    assert boss.decode_boss_tables(tables) == {"Good": {"hp": 1}, "Also": {"hp": 2}}
+    assert len(calls) == 1 + len(tables)
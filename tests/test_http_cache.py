@@ -0,0 +1,95 @@
+import sys
+import os
+import json
+import pytest
+
+# Ensure the 'scripts' directory is on sys.path to import the ETL modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts')))
+
+import http_cache
+import tree_etl
+
+TREE_BODY = json.dumps({"nodes": {"1": {"skillId": "life1"}}, "groups": {}}).encode("utf-8")
+
+
+class DummyResponse:
+    def __init__(self, status_code, headers=None, body=b""):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self._body), chunk_size):
+            yield self._body[i:i + chunk_size]
+
+    def raise_for_status(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class DummySession:
+    """Serves tree.json with a fixed ETag and honours If-None-Match."""
+    def __init__(self):
+        self.sent_headers = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.sent_headers.append(dict(headers or {}))
+        if (headers or {}).get("If-None-Match") == '"v1"':
+            return DummyResponse(304)
+        return DummyResponse(200, {"ETag": '"v1"'}, TREE_BODY)
+
+
+@pytest.fixture
+def session(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, "CACHE_PATH", tmp_path / ".http_cache.json")
+    monkeypatch.setattr(tree_etl, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(tree_etl, "RAW_DIR", tmp_path / "raw_trees")
+    (tmp_path / "raw_trees").mkdir()
+    dummy = DummySession()
+    monkeypatch.setattr(tree_etl, "SESSION", dummy)
+    return dummy
+
+
+def test_unchanged_tree_reuses_previous_snapshot(session, tmp_path):
+    first = tree_etl.fetch_tree("401")
+    assert session.sent_headers[0] == {}
+    assert first.read_bytes() == TREE_BODY
+    wrapper = json.loads((tmp_path / "tree401.json").read_text(encoding="utf-8"))
+    assert wrapper["passive_tree"]["nodes"]["1"]["skill_id"] == "life1"
+
+    # A 304 must leave the wrapper and raw snapshots untouched
+    mtime = (tmp_path / "tree.json").stat().st_mtime_ns
+    second = tree_etl.fetch_tree("401")
+    assert session.sent_headers[1] == {"If-None-Match": '"v1"'}
+    assert second == first
+    assert (tmp_path / "tree.json").stat().st_mtime_ns == mtime
+    assert len(list((tmp_path / "raw_trees").iterdir())) == 1
+
+
+def test_deleted_output_forces_full_download(session, tmp_path):
+    tree_etl.fetch_tree("401")
+    (tmp_path / "tree.json").unlink()
+
+    tree_etl.fetch_tree("401")
+    assert session.sent_headers[1] == {}
+    assert (tmp_path / "tree.json").exists()
+
+
+def test_conditional_headers_include_both_validators(tmp_path):
+    out = tmp_path / "snap.lua"
+    out.write_text("return {}", encoding="utf-8")
+    cache = {}
+    resp = DummyResponse(200, {"ETag": '"e"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+    http_cache.remember(cache, "u", resp, out)
+
+    assert http_cache.conditional_headers(cache, "u") == {
+        "If-None-Match": '"e"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+    assert http_cache.cached_outputs(cache, "u") == [out]
+    assert http_cache.conditional_headers(cache, "other") == {}
@@ -0,0 +1,101 @@
+import sys
+import os
+import sqlite3
+import pytest
+
+# Ensure the 'scripts' directory is on sys.path to import the ETL modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts')))
+
+import setup_db
+import tree_etl
+import tree_loader
+
+
+@pytest.fixture
+def conn(tmp_path):
+    # Build the real schema on disk, then work on an in-memory copy of it
+    db_file = tmp_path / "schema.db"
+    setup_db.run_setup(str(db_file))
+    disk = sqlite3.connect(str(db_file))
+    mem = sqlite3.connect(":memory:")
+    disk.backup(mem)
+    disk.close()
+    yield mem
+    mem.close()
+
+
+def make_tree(groups):
+    return {
+        "passive_tree": {
+            "groups": groups,
+            "nodes": {
+                # Non-numeric keys are not passive nodes and must be skipped
+                "root": {"connections": [{"id": 1}]},
+                "1": {
+                    "group": 7,
+                    "skill_id": "life1",
+                    "name": "Life",
+                    "classesStart": ["Warrior"],
+                    "connections": [{"id": 2, "radius": 0}],
+                },
+                "2": {
+                    "group": "8",
+                    "name": "Asc",
+                    "ascendancyName": "Titan",
+                    "connections": [1],
+                },
+            },
+        },
+        "passive_skills": {"life1": {"stats": ["+10 to maximum Life"]}},
+    }
+
+
+# Group ids deliberately differ in type from the nodes' 'group' values:
+# lookups go through str(), so 7 matches "7" and "8" matches 8
+GROUP_SHAPES = {
+    "list": [{"id": "7", "x": 10, "y": 20}, {"id": 8, "x": 30, "y": 40}],
+    "dict": {"7": {"x": 10, "y": 20}, 8: {"x": 30, "y": 40}},
+}
+
+
+@pytest.mark.parametrize("shape", sorted(GROUP_SHAPES))
+def test_load_pipeline_loads_numeric_nodes(conn, shape):
+    vid = tree_etl.upsert_version(conn, "test")
+    tree_etl.load_pipeline(conn, vid, make_tree(GROUP_SHAPES[shape]))
+
+    nodes = conn.execute(
+        "SELECT node_id, typeof(node_id), x, y FROM passive_nodes ORDER BY node_id"
+    ).fetchall()
+    assert nodes == [(1, "integer", 10, 20), (2, "integer", 30, 40)]
+
+    edges = conn.execute(
+        "SELECT from_node_id, to_node_id FROM node_edges ORDER BY 1, 2"
+    ).fetchall()
+    assert edges == [(1, 2), (2, 1)]
+
+    effects = conn.execute(
+        "SELECT node_id, typeof(node_id), stat_key FROM node_effects"
+    ).fetchall()
+    assert effects == [(1, "integer", "+10 to maximum Life")]
+
+    starts = conn.execute("SELECT node_id, class, x, y FROM starting_nodes").fetchall()
+    assert starts == [(1, "Warrior", 10, 20)]
+
+    asc = conn.execute("SELECT ascendancy, node_id, x, y FROM ascendancy_nodes").fetchall()
+    assert asc == [("Titan", 2, 30, 40)]
+
+
+def test_index_nodes_accepts_int_and_numeric_str_keys():
+    nodes = {"root": {}, "12": {"a": 1}, "-3": {"b": 2}, 40: {"c": 3}}
+    index = tree_loader.index_nodes(nodes)
+    assert index == {12: {"a": 1}, -3: {"b": 2}, 40: {"c": 3}}
+    # Re-indexing an index is a no-op
+    assert tree_loader.index_nodes(index) == index
+
+
+def test_loaders_normalize_str_keyed_nodes(conn):
+    # Callers passing the tree's own str-keyed dict still get integer ids
+    nodes = {"root": {}, "5": {"stats": ["+5 to Strength"]}}
+    tree_loader.load_effects(conn, 1, nodes)
+    rows = conn.execute("SELECT node_id, typeof(node_id), stat_key FROM node_effects").fetchall()
+    assert rows == [(5, "integer", "+5 to Strength")]